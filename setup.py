@@ -42,7 +42,9 @@ def post_install():
 
     # Copy the bospm.py script to the installation directory
     src_path = os.path.join('src', 'bospm', 'bospm.py')
-    shutil.copy(src_path, install_dir)
+    dst_path = os.path.join(install_dir, 'bospm.py')
+    shutil.copyfile(src_path, dst_path)
+    os.chmod(dst_path, 0o644)
     print(f"bospm has been installed to {install_dir}")
     if sys.platform.startswith('win'):
         print("Please add the following directory to your PATH:")
@@ -90,6 +92,7 @@ setup(
     python_requires=">=2.7",
     extras_require={
         "dev": ["pytest", "pytest-cov[all]", "mypy", "black"],
+        "fast": ["blake3", "orjson"],
     },
     entry_points={
         'console_scripts': [
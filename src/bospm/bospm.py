@@ -18,12 +18,13 @@
 import os
 import sys
 import json
-import hashlib
-import tarfile
+import copy
+import contextlib
+import functools
 import shutil
 import re
-import platform
-import requests
+import time
+from collections import deque
 from typing import Dict, List, Tuple
 
 # Configuration
@@ -32,44 +33,296 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
 PACKAGE_DIR = os.path.join(CONFIG_DIR, 'packages')
 REPO_DIR = os.path.join(CONFIG_DIR, 'repo')
 INSTALL_DIR = os.path.join(CONFIG_DIR, 'installed')
+REPO_INDEX_FILE = os.path.join(CONFIG_DIR, 'repo_index.json')
+CHECKSUM_CACHE_FILE = os.path.join(CONFIG_DIR, 'checksum_cache.json')
+DIRS_SENTINEL_FILE = os.path.join(CONFIG_DIR, '.dirs_ok')
+CONFIG_CACHE = {'key': None, 'value': None}
 
 # Repository and website URLs
 GITHUB_REPO = "https://github.com/Architecture-Mechanism/bellande_operating_system_package"
+GITHUB_API = "https://api.github.com/repos/Architecture-Mechanism/bellande_operating_system_package/contents"
 TEMP_WEBSITE = "https://bellande-architecture-mechanism-research-innovation-center.org/bospm_packages"  # Temporary website URL
+HTTP_TIMEOUT = 10
+HTTP_SESSION = None
+
+# Package file links on the GitHub tree page; [^"] keeps the match linear
+PACKAGE_TITLE_PATTERN = re.compile(r'title="([^"]*?\.json)"')
+VERSION_PATTERN = re.compile(r'\A\d+(?:\.\d+)*\Z')
+
+# Read size used when hashing package files, and slice size when hashing a mapped file
+CHECKSUM_BUFFER_SIZE = 1 << 20
+MMAP_SLICE_SIZE = 64 << 20
+
+# Tree checksum: SHA-256 over the concatenated SHA-256 digests of fixed-size chunks
+TREE_CHECKSUM_ALGO = "bospm-tree-sha256-8M"
+TREE_CHECKSUM_CHUNK_SIZE = 8 << 20
+# Chunk buffers hashed concurrently on the read path, bounding its memory to 64 MiB
+TREE_CHECKSUM_MAX_IN_FLIGHT = 8
+
+# Block size for streaming tar reads and writes
+TAR_BUFFER_SIZE = 1 << 20
+
+# Package archive extension per compression format
+PACKAGE_EXTENSIONS = {'gz': '.tar.gz', 'zst': '.tar.zst'}
 
 def ensure_dirs():
+    # The sentinel is only trusted while the directories bospm writes into still exist,
+    # so a removed repo or install directory is recreated like before
+    if os.path.exists(DIRS_SENTINEL_FILE) and os.path.isdir(REPO_DIR) and os.path.isdir(INSTALL_DIR):
+        return
     for dir in [CONFIG_DIR, PACKAGE_DIR, REPO_DIR, INSTALL_DIR]:
         os.makedirs(dir, exist_ok=True)
+    open(DIRS_SENTINEL_FILE, 'w').close()
 
 # Utility functions
+def advise_sequential(f):
+    # Let the kernel read ahead aggressively so disk reads overlap with hashing
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def map_file(f):
+    # Empty files cannot be mapped; None tells the caller to read the file instead
+    import mmap
+    if not os.fstat(f.fileno()).st_size:
+        return None
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        return None
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
 def calculate_checksum(file_path: str) -> str:
-    with open(file_path, "rb") as f:
-        file_hash = hashlib.sha256()
-        chunk = f.read(8192)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = f.read(8192)
+    # hashlib's SHA-256 is OpenSSL's, which runs on the CPU's SHA instructions where available
+    import hashlib
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb", buffering=0) as f:
+        # Large packages are hashed straight out of the page cache; smaller ones are not worth the mapping
+        mapped = map_file(f) if os.fstat(f.fileno()).st_size >= MMAP_SLICE_SIZE else None
+        if mapped is not None:
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), MMAP_SLICE_SIZE):
+                    file_hash.update(view[offset:offset + MMAP_SLICE_SIZE])
+            return file_hash.hexdigest()
+
+        advise_sequential(f)
+        # Python 3.11+ runs the whole read/update loop in C
+        file_digest = getattr(hashlib, 'file_digest', None)
+        if file_digest is not None:
+            return file_digest(f, "sha256").hexdigest()
+
+        buffer = bytearray(CHECKSUM_BUFFER_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(view)
+            if not size:
+                break
+            file_hash.update(view[:size])
+    return file_hash.hexdigest()
+
+
+def read_chunk(f, view: memoryview) -> int:
+    filled = 0
+    while filled < len(view):
+        size = f.readinto(view[filled:])
+        if not size:
+            break
+        filled += size
+    return filled
+
+
+def calculate_tree_checksum(file_path: str) -> str:
+    import hashlib
+    from concurrent.futures import ThreadPoolExecutor
+    # hashlib releases the GIL while hashing, so chunks are digested in parallel
+    max_workers = os.cpu_count() or 1
+    digests = []
+    pending = deque()
+    with open(file_path, "rb", buffering=0) as f, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        mapped = map_file(f)
+        if mapped is not None:
+            with mapped, memoryview(mapped) as view:
+                offsets = range(0, len(view), TREE_CHECKSUM_CHUNK_SIZE)
+                digests = list(executor.map(
+                    lambda offset: hashlib.sha256(view[offset:offset + TREE_CHECKSUM_CHUNK_SIZE]).digest(), offsets))
+            return hashlib.sha256(b"".join(digests)).hexdigest()
+
+        advise_sequential(f)
+        max_in_flight = min(2 * max_workers, TREE_CHECKSUM_MAX_IN_FLIGHT)
+        while True:
+            if len(pending) >= max_in_flight:
+                # The oldest chunk's hash is done once its result is in, so its buffer can be refilled
+                future, view = pending.popleft()
+                digests.append(future.result().digest())
+            else:
+                view = memoryview(bytearray(TREE_CHECKSUM_CHUNK_SIZE))
+            size = read_chunk(f, view)
+            if not size:
+                break
+            pending.append((executor.submit(hashlib.sha256, view[:size]), view))
+            if size < len(view):
+                break
+        digests.extend(future.result().digest() for future, _ in pending)
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def blake3_available() -> bool:
+    try:
+        import blake3
+    except ImportError:
+        return False
+    return True
+
+
+def calculate_blake3_checksum(file_path: str) -> str:
+    # Memory-maps the file and hashes it on all cores with SIMD
+    import blake3
+    file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    file_hash.update_mmap(file_path)
     return file_hash.hexdigest()
 
 
+class TreeHasher:
+    # Streaming form of calculate_tree_checksum, for bytes that are hashed as they are written
+    def __init__(self):
+        self.buffer = bytearray()
+        self.digests = []
+
+    def update(self, data):
+        import hashlib
+        self.buffer += data
+        while len(self.buffer) >= TREE_CHECKSUM_CHUNK_SIZE:
+            with memoryview(self.buffer) as view:
+                self.digests.append(hashlib.sha256(view[:TREE_CHECKSUM_CHUNK_SIZE]).digest())
+            del self.buffer[:TREE_CHECKSUM_CHUNK_SIZE]
+
+    def hexdigest(self) -> str:
+        import hashlib
+        digests = (self.digests + [hashlib.sha256(self.buffer).digest()]) if self.buffer else self.digests
+        return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+class HashingWriter:
+    # File wrapper that feeds every written block to the given hashers
+    def __init__(self, f, hashers: List):
+        self.f = f
+        self.hashers = hashers
+
+    def write(self, data) -> int:
+        for hasher in self.hashers:
+            hasher.update(data)
+        return self.f.write(data)
+
+
+@functools.lru_cache(maxsize=1)
+def json_loads():
+    # orjson parses several times faster when installed; it accepts the same bytes json does
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def read_json(path: str):
+    with open(path, 'rb') as f:
+        return json_loads()(f.read())
+
+
+def write_json_atomic(path: str, data: Dict):
+    # Write a sibling temp file and rename it over the target, so a crash never leaves a torn file
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checksum_cache() -> Dict:
+    if os.path.exists(CHECKSUM_CACHE_FILE):
+        return read_json(CHECKSUM_CACHE_FILE)
+    return {}
+
+
+def save_checksum_cache(cache: Dict):
+    write_json_atomic(CHECKSUM_CACHE_FILE, cache)
+
+
+def store_cached_checksum(file_path: str, algo: str, checksum: str, cache: Dict = None):
+    # A cached digest is only reused while the file's mtime and size are unchanged
+    cache = load_checksum_cache() if cache is None else cache
+    stat = os.stat(file_path)
+    cache[os.path.abspath(file_path)] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "algo": algo,
+        "checksum": checksum
+    }
+    # Entries are keyed by path, so archives that were deleted since would otherwise stay forever
+    for cached_path in [path for path in cache if not os.path.exists(path)]:
+        del cache[cached_path]
+    save_checksum_cache(cache)
+
+
+def cached_checksum(file_path: str, algo: str) -> str:
+    cache = load_checksum_cache()
+    stat = os.stat(file_path)
+    entry = cache.get(os.path.abspath(file_path))
+    if entry and entry['algo'] == algo and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return entry['checksum']
+
+    if algo == TREE_CHECKSUM_ALGO:
+        checksum = calculate_tree_checksum(file_path)
+    elif algo == 'sha256':
+        checksum = calculate_checksum(file_path)
+    elif algo == 'blake3':
+        checksum = calculate_blake3_checksum(file_path)
+    else:
+        raise ValueError(f"Unsupported checksum algorithm: {algo}")
+    store_cached_checksum(file_path, algo, checksum, cache)
+    return checksum
+
+
+def verify_checksum(file_path: str, package_info: Dict) -> bool:
+    # A truncated or replaced archive is rejected without hashing it
+    if 'size' in package_info and os.path.getsize(file_path) != package_info['size']:
+        return False
+    if 'checksum_blake3' in package_info and blake3_available():
+        return cached_checksum(file_path, 'blake3') == package_info['checksum_blake3']
+    if 'checksum_tree' in package_info:
+        return cached_checksum(file_path, TREE_CHECKSUM_ALGO) == package_info['checksum_tree']
+    # Packages from before checksum_tree may name another algorithm for the checksum field
+    algo = package_info.get('checksum_algo', 'sha256')
+    return cached_checksum(file_path, algo) == package_info['checksum']
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_version(version: str) -> Tuple[int, ...]:
+    # Trailing zeros are dropped so that 1.0 and 1 compare equal
+    parts = [int(x) for x in version.split('.')]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
 def compare_versions(version1: str, version2: str) -> int:
-    v1_parts = [int(x) for x in version1.split('.')]
-    v2_parts = [int(x) for x in version2.split('.')]
-    for i in range(max(len(v1_parts), len(v2_parts))):
-        v1 = v1_parts[i] if i < len(v1_parts) else 0
-        v2 = v2_parts[i] if i < len(v2_parts) else 0
-        if v1 > v2:
-            return 1
-        elif v1 < v2:
-            return -1
-    return 0
+    v1, v2 = parse_version(version1), parse_version(version2)
+    return (v1 > v2) - (v1 < v2)
 
 
 def is_valid_version(version: str) -> bool:
-    return bool(re.match(r'^\d+(\.\d+)*$', version))
+    return VERSION_PATTERN.match(version) is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_system_info() -> Dict[str, str]:
+    # Platform details cannot change within a process, so probe them once
+    import platform
     return {
         "os": platform.system().lower(),
         "architecture": platform.machine().lower(),
@@ -77,37 +330,223 @@ def get_system_info() -> Dict[str, str]:
     }
 
 
+def get_sha256_cpu_extensions() -> str:
+    # OpenSSL dispatches SHA-256 to SHA-NI (x86) or SHA2 (ARMv8) rounds at runtime when the CPU has them
+    if os.path.exists('/proc/cpuinfo'):
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    flags = value.split()
+                    if 'sha_ni' in flags:
+                        return 'sha_ni'
+                    if 'sha2' in flags:
+                        return 'sha2'
+                    return 'none'
+        return 'none'
+    if sys.platform == 'darwin' and get_system_info()["architecture"] == 'arm64':
+        return 'sha2'
+    return 'unknown'
+
+
+def print_system_info():
+    import hashlib
+    import ssl
+    system_info = get_system_info()
+    backend = "OpenSSL" if hashlib.sha256.__name__.startswith('openssl_') else "built-in"
+    print(f"OS: {system_info['os']}")
+    print(f"Architecture: {system_info['architecture']}")
+    print(f"Python: {system_info['python_version']}")
+    print(f"SHA-256 backend: {backend} ({ssl.OPENSSL_VERSION})")
+    print(f"SHA-256 CPU extensions: {get_sha256_cpu_extensions()}")
+
+
 # Package management functions
 def load_config() -> Dict:
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {'installed_packages': {}}
+    # Re-parse only when the file's mtime or size changed; callers get their own copy to mutate
+    try:
+        stat = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return {'installed_packages': {}}
+    key = (stat.st_mtime_ns, stat.st_size)
+    if CONFIG_CACHE['key'] != key:
+        CONFIG_CACHE['value'] = read_json(CONFIG_FILE)
+        CONFIG_CACHE['key'] = key
+    return copy.deepcopy(CONFIG_CACHE['value'])
 
 
 def save_config(config: Dict):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json_atomic(CONFIG_FILE, config)
+    CONFIG_CACHE['key'] = None
+
+
+@contextlib.contextmanager
+def config_transaction():
+    # Edits made in the block are saved once on success, and only if something changed
+    config = load_config()
+    original = copy.deepcopy(config)
+    yield config
+    if config != original:
+        save_config(config)
+
+
+# Repository index: {package: {os: {arch: [versions, oldest first]}}}, stored together with
+# the REPO_DIR mtime it was built from
+def add_to_index(index: Dict, package_name: str, version: str, os_target: str, arch_target: str):
+    versions = index.setdefault(package_name, {}).setdefault(os_target, {}).setdefault(arch_target, [])
+    if version not in versions:
+        versions.append(version)
+        versions.sort(key=parse_version)
+
+
+def repo_mtime_ns():
+    mtime = os.stat(REPO_DIR).st_mtime_ns
+    # As with git's racy index check, a directory changed within the last couple of seconds can
+    # change again without its mtime moving, so such a snapshot is not trusted
+    if time.time_ns() - mtime < 2 * 10**9:
+        return None
+    return mtime
+
+
+def rebuild_index() -> Dict:
+    # Taken before the scan, so files added while scanning make the saved index stale
+    mtime = repo_mtime_ns()
+    index = {}
+    with os.scandir(REPO_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            parts = entry.name[:-5].rsplit('-', 3)
+            if len(parts) == 4 and is_valid_version(parts[1]):
+                add_to_index(index, *parts)
+    save_index(index, mtime)
+    return index
+
+
+def load_index() -> Dict:
+    # Any change to REPO_DIR's mtime, including one that moves it backwards after a restore
+    # with rsync -a or tar x, means info files may have been added or removed
+    try:
+        stored = read_json(REPO_INDEX_FILE)
+    except FileNotFoundError:
+        return rebuild_index()
+    mtime = stored.get('repo_mtime_ns')
+    if mtime is None or mtime != os.stat(REPO_DIR).st_mtime_ns:
+        return rebuild_index()
+    return stored['packages']
+
+
+def save_index(index: Dict, mtime: int):
+    write_json_atomic(REPO_INDEX_FILE, {"repo_mtime_ns": mtime, "packages": index})
+
+
+def add_package_files(tar, files: List[str]):
+    for file in files:
+        tar.add(file, arcname=os.path.basename(file))
+
+
+def pipe_package_archive(command: List[str], out, files: List[str]):
+    # tarfile only serializes the stream; the external compressor runs on every core
+    import subprocess
+    import tarfile
+    import threading
+    compressor = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    errors = []
+
+    def copy_output():
+        try:
+            shutil.copyfileobj(compressor.stdout, out, TAR_BUFFER_SIZE)
+        except Exception as e:
+            errors.append(e)
+            # Unblock the compressor so the tar writer sees a broken pipe instead of hanging
+            compressor.stdout.close()
+
+    reader = threading.Thread(target=copy_output)
+    reader.start()
+    pipe_error = None
+    try:
+        with tarfile.open(fileobj=compressor.stdin, mode="w|", bufsize=TAR_BUFFER_SIZE) as tar:
+            add_package_files(tar, files)
+    except BrokenPipeError as e:
+        # The compressor went away early; a copy error or its exit status is the better report
+        pipe_error = e
+    finally:
+        try:
+            compressor.stdin.close()
+        except BrokenPipeError as e:
+            pipe_error = pipe_error or e
+        reader.join()
+        returncode = compressor.wait()
+    if errors:
+        raise errors[0]
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command)
+    if pipe_error:
+        raise pipe_error
+
+
+def zstd_available() -> bool:
+    return shutil.which("zstd") is not None or sys.version_info >= (3, 14)
+
+
+def write_package_archive(out, files: List[str], compression: str = 'gz'):
+    import tarfile
+    if compression == 'zst':
+        zstd_bin = shutil.which("zstd")
+        if zstd_bin:
+            pipe_package_archive([zstd_bin, "-T0", "-q", "-c"], out, files)
+            return
+        if sys.version_info < (3, 14):
+            raise FileNotFoundError("zstd is required to create .tar.zst packages")
+        with tarfile.open(fileobj=out, mode="w|zst", bufsize=TAR_BUFFER_SIZE) as tar:
+            add_package_files(tar, files)
+        return
 
+    pigz_bin = shutil.which("pigz")
+    if pigz_bin:
+        pipe_package_archive([pigz_bin, "-c"], out, files)
+        return
+    with tarfile.open(fileobj=out, mode="w|gz", bufsize=TAR_BUFFER_SIZE) as tar:
+        add_package_files(tar, files)
 
-def create_package(package_name: str, version: str, files: List[str], os_target: str = None, arch_target: str = None):
+
+def create_package(package_name: str, version: str, files: List[str], os_target: str = None, arch_target: str = None,
+                   compression: str = 'gz'):
     ensure_dirs()
     if not is_valid_version(version):
         print(f"Invalid version format: {version}")
         return
 
+    if compression == 'zst' and not zstd_available():
+        print("zstd is required to create .tar.zst packages (install it or use Python 3.14+)")
+        return
+
     system_info = get_system_info()
     os_target = os_target or system_info["os"]
     arch_target = arch_target or system_info["architecture"]
 
-    package_file = f"{package_name}-{version}-{os_target}-{arch_target}.tar.gz"
+    package_file = f"{package_name}-{version}-{os_target}-{arch_target}{PACKAGE_EXTENSIONS[compression]}"
     package_path = os.path.join(REPO_DIR, package_file)
     
-    with tarfile.open(package_path, "w:gz") as tar:
-        for file in files:
-            tar.add(file, arcname=os.path.basename(file))
+    # Checksums are computed from the bytes as they are written, so the archive is never re-read
+    import hashlib
+    sha256_hasher = hashlib.sha256()
+    tree_hasher = TreeHasher()
+    hashers = [sha256_hasher, tree_hasher]
+    if blake3_available():
+        import blake3
+        blake3_hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hashers.append(blake3_hasher)
+    try:
+        with open(package_path, "wb") as f:
+            write_package_archive(HashingWriter(f, hashers), files, compression)
+    except BaseException:
+        # Never leave a truncated archive in the repository
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(package_path)
+        raise
     
-    checksum = calculate_checksum(package_path)
+    checksum_tree = tree_hasher.hexdigest()
     
     package_info = {
         "name": package_name,
@@ -115,86 +554,162 @@ def create_package(package_name: str, version: str, files: List[str], os_target:
         "os": os_target,
         "architecture": arch_target,
         "files": [os.path.basename(f) for f in files],
-        "checksum": checksum
+        "file": package_file,
+        "compression": compression,
+        "size": os.path.getsize(package_path),
+        "checksum": sha256_hasher.hexdigest(),
+        "checksum_tree": checksum_tree
     }
+    # 'checksum' is the plain SHA-256 that sha256sum and older bospm check; checksum_tree (parallel
+    # SHA-256 over 8 MiB chunks) and checksum_blake3 are faster alternatives that installers prefer
+    if blake3_available():
+        package_info["checksum_blake3"] = blake3_hasher.hexdigest()
+        store_cached_checksum(package_path, 'blake3', package_info["checksum_blake3"])
+    else:
+        store_cached_checksum(package_path, TREE_CHECKSUM_ALGO, checksum_tree)
     
     info_file = os.path.join(REPO_DIR, f"{package_name}-{version}-{os_target}-{arch_target}.json")
     with open(info_file, 'w') as f:
         json.dump(package_info, f, indent=2)
+    # The new info file changes REPO_DIR's mtime, so the index is rebuilt on its next use
     
     print(f"Package {package_name} version {version} for {os_target}-{arch_target} created successfully.")
 
 
+@functools.lru_cache(maxsize=1024)
+def load_package_info(info_file: str, mtime_ns: int) -> Dict:
+    # Cached per file version; callers must not mutate the returned dict
+    return read_json(info_file)
+
+
 def get_package_info(package_name: str, version: str, os_target: str = None, arch_target: str = None) -> Dict:
     system_info = get_system_info()
     os_target = os_target or system_info["os"]
     arch_target = arch_target or system_info["architecture"]
 
     info_file = os.path.join(REPO_DIR, f"{package_name}-{version}-{os_target}-{arch_target}.json")
-    if not os.path.exists(info_file):
+    try:
+        stat = os.stat(info_file)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Package {package_name} version {version} for {os_target}-{arch_target} not found.")
     
-    with open(info_file, 'r') as f:
-        return json.load(f)
+    return load_package_info(info_file, stat.st_mtime_ns)
+
+
+def extract_tar_stream(f, mode: str, extract_dir: str):
+    import tarfile
+    with tarfile.open(fileobj=f, mode=mode, bufsize=TAR_BUFFER_SIZE) as tar:
+        for member in tar:
+            tar.extract(member, path=extract_dir)
+
+
+def extract_package(package_path: str, extract_dir: str, compression: str = 'gz'):
+    import subprocess
+    if compression not in PACKAGE_EXTENSIONS:
+        raise ValueError(f"Unsupported package compression: {compression}")
+    # Native tar is much faster than tarfile; Windows keeps the Python path
+    tar_bin = None if sys.platform.startswith('win') else shutil.which("tar")
+
+    if compression == 'zst':
+        zstd_bin = shutil.which("zstd")
+        if zstd_bin:
+            command = [zstd_bin, "-d", "-q", "-c", "--", package_path]
+            zstd = subprocess.Popen(command, stdout=subprocess.PIPE)
+            try:
+                if tar_bin:
+                    subprocess.run([tar_bin, "-xf", "-", "-C", extract_dir], stdin=zstd.stdout, check=True)
+                else:
+                    extract_tar_stream(zstd.stdout, "r|", extract_dir)
+            finally:
+                zstd.stdout.close()
+                returncode = zstd.wait()
+            if returncode:
+                raise subprocess.CalledProcessError(returncode, command)
+            return
+        if sys.version_info < (3, 14):
+            raise FileNotFoundError("zstd is required to install .tar.zst packages")
+        with open(package_path, "rb", buffering=TAR_BUFFER_SIZE) as f:
+            extract_tar_stream(f, "r|zst", extract_dir)
+        return
+
+    if tar_bin:
+        # Feed the archive on stdin so a ':' in the path is never taken as a remote host
+        with open(package_path, "rb") as f:
+            subprocess.run([tar_bin, "-xzf", "-", "-C", extract_dir], stdin=f, check=True)
+        return
+    with open(package_path, "rb", buffering=TAR_BUFFER_SIZE) as f:
+        extract_tar_stream(f, "r|gz", extract_dir)
 
 
 def install_package(package_name: str, version: str, os_target: str = None, arch_target: str = None):
-    config = load_config()
     ensure_dirs()
     
     system_info = get_system_info()
     os_target = os_target or system_info["os"]
     arch_target = arch_target or system_info["architecture"]
 
-    if package_name in config['installed_packages']:
-        installed_version = config['installed_packages'][package_name]['version']
-        if compare_versions(version, installed_version) <= 0:
-            print(f"Package {package_name} version {installed_version} is already installed and up to date.")
-            return
-        print(f"Upgrading {package_name} from version {installed_version} to {version}")
-
     try:
-        package_info = get_package_info(package_name, version, os_target, arch_target)
-        package_file = f"{package_name}-{version}-{os_target}-{arch_target}.tar.gz"
-        package_path = os.path.join(REPO_DIR, package_file)
-        
-        if not os.path.exists(package_path):
-            raise FileNotFoundError(f"Package file {package_file} not found.")
-        
-        if calculate_checksum(package_path) != package_info['checksum']:
-            raise ValueError("Package checksum mismatch. The package may have been tampered with.")
-        
-        extract_dir = os.path.join(INSTALL_DIR, package_name, version)
-        os.makedirs(extract_dir, exist_ok=True)
-        with tarfile.open(package_path, "r:gz") as tar:
-            tar.extractall(path=extract_dir)
-        
-        config['installed_packages'][package_name] = {
-            'version': version,
-            'os': os_target,
-            'architecture': arch_target
-        }
-        save_config(config)
+        with config_transaction() as config:
+            if package_name in config['installed_packages']:
+                installed_version = config['installed_packages'][package_name]['version']
+                if compare_versions(version, installed_version) <= 0:
+                    print(f"Package {package_name} version {installed_version} is already installed and up to date.")
+                    return
+                print(f"Upgrading {package_name} from version {installed_version} to {version}")
+
+            package_info = get_package_info(package_name, version, os_target, arch_target)
+            package_file = package_info.get('file', f"{package_name}-{version}-{os_target}-{arch_target}.tar.gz")
+            package_path = os.path.join(REPO_DIR, package_file)
+            
+            if not os.path.exists(package_path):
+                raise FileNotFoundError(f"Package file {package_file} not found.")
+            
+            if not verify_checksum(package_path, package_info):
+                raise ValueError("Package checksum mismatch. The package may have been tampered with.")
+            
+            extract_dir = os.path.join(INSTALL_DIR, package_name, version)
+            os.makedirs(extract_dir, exist_ok=True)
+            # Info files written before zstd support have no compression field and are gzip
+            extract_package(package_path, extract_dir, package_info.get('compression', 'gz'))
+            
+            config['installed_packages'][package_name] = {
+                'version': version,
+                'os': os_target,
+                'architecture': arch_target
+            }
         print(f"Package {package_name} version {version} for {os_target}-{arch_target} installed successfully.")
     except Exception as e:
         print(f"Failed to install package {package_name}: {str(e)}")
 
 
-def uninstall_package(package_name: str):
-    config = load_config()
-    if package_name not in config['installed_packages']:
-        print(f"Package {package_name} is not installed.")
-        return
+def remove_install_dir(package_dir: str):
+    install_root = os.path.realpath(INSTALL_DIR)
+    target = os.path.realpath(package_dir)
+    if target == install_root or os.path.commonpath([install_root, target]) != install_root:
+        raise ValueError(f"Refusing to remove {package_dir}: not inside {INSTALL_DIR}")
+    
+    # rm walks the tree with fts in C; shutil.rmtree does a Python-level scandir per directory
+    rm_bin = None if sys.platform.startswith('win') else shutil.which("rm")
+    if rm_bin:
+        import subprocess
+        subprocess.run([rm_bin, "-rf", "--", target], check=True)
+    else:
+        shutil.rmtree(target)
 
+
+def uninstall_package(package_name: str):
     try:
-        package_info = config['installed_packages'][package_name]
-        version = package_info['version']
-        os_target = package_info['os']
-        arch_target = package_info['architecture']
-        package_dir = os.path.join(INSTALL_DIR, package_name)
-        shutil.rmtree(package_dir)
-        del config['installed_packages'][package_name]
-        save_config(config)
+        with config_transaction() as config:
+            if package_name not in config['installed_packages']:
+                print(f"Package {package_name} is not installed.")
+                return
+
+            package_info = config['installed_packages'][package_name]
+            version = package_info['version']
+            os_target = package_info['os']
+            arch_target = package_info['architecture']
+            remove_install_dir(os.path.join(INSTALL_DIR, package_name))
+            del config['installed_packages'][package_name]
         print(f"Package {package_name} version {version} for {os_target}-{arch_target} uninstalled successfully.")
     except Exception as e:
         print(f"Failed to uninstall package {package_name}: {str(e)}")
@@ -210,32 +725,66 @@ def list_packages():
             print(f"- {package} (version {info['version']}, {info['os']}-{info['architecture']})")
 
 
-def list_available_packages_github():
-    print("Available packages from GitHub repository:")
-    try:
-        response = requests.get(f"{GITHUB_REPO}/tree/main")
-        if response.status_code == 200:
-            packages = re.findall(r'title="(.*?\.json)"', response.text)
-            for package in packages:
-                print(f"- {package[:-5]}")  # Remove .json extension
-        else:
-            print(f"Failed to fetch packages from GitHub. Status code: {response.status_code}")
-    except Exception as e:
-        print(f"Error fetching packages from GitHub: {str(e)}")
+def get_http_session() -> 'requests.Session':
+    # One pooled session so repeated listings reuse the TCP/TLS connection
+    global HTTP_SESSION
+    if HTTP_SESSION is None:
+        import requests
+        HTTP_SESSION = requests.Session()
+    return HTTP_SESSION
+
+
+def fetch_available_packages_github() -> List[str]:
+    session = get_http_session()
+    response = session.get(GITHUB_API, params={"ref": "main"}, timeout=HTTP_TIMEOUT)
+    if response.status_code == 200:
+        packages = [entry['name'] for entry in response.json()
+                    if entry['type'] == 'file' and entry['name'].endswith('.json')]
+    else:
+        # Anonymous API calls are rate limited, so fall back to scraping the tree page
+        response = session.get(f"{GITHUB_REPO}/tree/main", timeout=HTTP_TIMEOUT)
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch packages from GitHub. Status code: {response.status_code}")
+        packages = PACKAGE_TITLE_PATTERN.findall(response.text)
+    return [package[:-5] for package in packages]  # Remove .json extension
+
+
+def fetch_available_packages_website() -> List[str]:
+    response = get_http_session().get(TEMP_WEBSITE, timeout=HTTP_TIMEOUT)
+    if response.status_code != 200:
+        raise RuntimeError(f"Failed to fetch packages from website. Status code: {response.status_code}")
+    packages = response.json()  # Assuming the website returns a JSON list of packages
+    return [f"{package['name']} (version {package['version']}, {package['os']}-{package['architecture']})"
+            for package in packages]
 
 
-def list_available_packages_website():
-    print("Available packages from website:")
+def print_available_packages(title: str, source_name: str, fetch):
+    print(f"Available packages from {title}:")
     try:
-        response = requests.get(TEMP_WEBSITE)
-        if response.status_code == 200:
-            packages = response.json()  # Assuming the website returns a JSON list of packages
-            for package in packages:
-                print(f"- {package['name']} (version {package['version']}, {package['os']}-{package['architecture']})")
-        else:
-            print(f"Failed to fetch packages from website. Status code: {response.status_code}")
+        for package in fetch():
+            print(f"- {package}")
+    except RuntimeError as e:
+        print(str(e))
     except Exception as e:
-        print(f"Error fetching packages from website: {str(e)}")
+        print(f"Error fetching packages from {source_name}: {str(e)}")
+
+
+# source -> (listing title, name used in error messages, fetch function)
+PACKAGE_SOURCES = {
+    'github': ("GitHub repository", "GitHub", fetch_available_packages_github),
+    'website': ("website", "website", fetch_available_packages_website),
+}
+
+
+def list_available_packages(source: str = 'github'):
+    # Fetch the selected sources concurrently, then print them in table order
+    from concurrent.futures import ThreadPoolExecutor
+    sources = list(PACKAGE_SOURCES.values()) if source == 'all' else [PACKAGE_SOURCES[source]]
+    get_http_session()
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [executor.submit(fetch) for _, _, fetch in sources]
+        for (title, source_name, _), future in zip(sources, futures):
+            print_available_packages(title, source_name, future.result)
 
 
 def update_package(package_name: str, version: str = None, os_target: str = None, arch_target: str = None):
@@ -264,66 +813,170 @@ def update_package(package_name: str, version: str = None, os_target: str = None
 
 
 def find_latest_version(package_name: str, os_target: str, arch_target: str) -> str:
-    versions = []
-    for file in os.listdir(REPO_DIR):
-        if file.startswith(f"{package_name}-") and file.endswith(f"-{os_target}-{arch_target}.json"):
-            version = file.split('-')[1]
-            if is_valid_version(version):
-                versions.append(version)
-    
+    versions = load_index().get(package_name, {}).get(os_target, {}).get(arch_target)
     if not versions:
         raise ValueError(f"No versions found for package {package_name} on {os_target}-{arch_target}")
     
-    return max(versions, key=lambda v: [int(x) for x in v.split('.')])
+    return versions[-1]
 
 
 # Command-line interface
-def print_usage():
-    print("Usage: bospm <command> [<args>]")
-    print("Commands:")
-    print("  create <package_name> <version> <file1> [<file2> ...] [--os <os>] [--arch <arch>]  Create a new package")
-    print("  install <package_name> <version> [--os <os>] [--arch <arch>]                       Install a package")
-    print("  uninstall <package_name>                                                           Uninstall a package")
-    print("  list                                                                               List installed packages")
-    print("  available [--source <github|website>]                                              List available packages")
-    print("  update <package_name> [<version>] [--os <os>] [--arch <arch>]                      Update a package")
+def add_target_arguments(parser: 'argparse.ArgumentParser'):
+    parser.add_argument('--os', dest='os_target', metavar='<os>', help='Target operating system')
+    parser.add_argument('--arch', dest='arch_target', metavar='<arch>', help='Target architecture')
+
+
+def add_create_parser(subparsers):
+    create_parser = subparsers.add_parser('create', help='Create a new package')
+    create_parser.add_argument('package_name')
+    create_parser.add_argument('version')
+    create_parser.add_argument('files', nargs='+')
+    add_target_arguments(create_parser)
+    create_parser.add_argument('--compression', choices=list(PACKAGE_EXTENSIONS), default='gz',
+                               help='Archive compression (zst needs the zstd tool or Python 3.14+)')
+
+
+def add_install_parser(subparsers):
+    install_parser = subparsers.add_parser('install', help='Install a package')
+    install_parser.add_argument('package_name')
+    install_parser.add_argument('version')
+    add_target_arguments(install_parser)
+
+
+def add_uninstall_parser(subparsers):
+    uninstall_parser = subparsers.add_parser('uninstall', help='Uninstall a package')
+    uninstall_parser.add_argument('package_name')
+
+
+def add_list_parser(subparsers):
+    subparsers.add_parser('list', help='List installed packages')
+
+
+def add_available_parser(subparsers):
+    available_parser = subparsers.add_parser('available', help='List available packages')
+    available_parser.add_argument('--source', choices=[*PACKAGE_SOURCES, 'all'], default='github')
+
+
+def add_update_parser(subparsers):
+    update_parser = subparsers.add_parser('update', help='Update a package')
+    update_parser.add_argument('package_name')
+    update_parser.add_argument('version', nargs='?')
+    add_target_arguments(update_parser)
+
+
+def add_info_parser(subparsers):
+    subparsers.add_parser('info', help='Show system and checksum acceleration details')
+
+
+COMMAND_HANDLERS = {
+    'create': lambda args: create_package(
+        args.package_name, args.version, args.files, args.os_target, args.arch_target, args.compression),
+    'install': lambda args: install_package(args.package_name, args.version, args.os_target, args.arch_target),
+    'uninstall': lambda args: uninstall_package(args.package_name),
+    'list': lambda args: list_packages(),
+    'available': lambda args: list_available_packages(args.source),
+    'update': lambda args: update_package(args.package_name, args.version, args.os_target, args.arch_target),
+    'info': lambda args: print_system_info(),
+}
+
+COMMAND_PARSERS = {
+    'create': add_create_parser,
+    'install': add_install_parser,
+    'uninstall': add_uninstall_parser,
+    'list': add_list_parser,
+    'available': add_available_parser,
+    'update': add_update_parser,
+    'info': add_info_parser,
+}
+
+
+# Fast path for well-formed command lines: (positionals, {flag: (dest, default, choices)}).
+# Must accept only what the argparse parsers above accept; anything else falls back to them.
+TARGET_OPTIONS = {'--os': ('os_target', None, None), '--arch': ('arch_target', None, None)}
+COMMAND_SHAPES = {
+    'create': (['package_name', 'version', 'files+'],
+               {**TARGET_OPTIONS, '--compression': ('compression', 'gz', list(PACKAGE_EXTENSIONS))}),
+    'install': (['package_name', 'version'], TARGET_OPTIONS),
+    'uninstall': (['package_name'], {}),
+    'list': ([], {}),
+    'available': ([], {'--source': ('source', 'github', [*PACKAGE_SOURCES, 'all'])}),
+    'update': (['package_name', 'version?'], TARGET_OPTIONS),
+    'info': ([], {}),
+}
+
+
+def parse_command_line(argv: List[str]):
+    if not argv or argv[0] not in COMMAND_SHAPES:
+        return None
+    positionals, options = COMMAND_SHAPES[argv[0]]
+    values = {'command': argv[0]}
+    for dest, default, _ in options.values():
+        values[dest] = default
+
+    arguments = []
+    seen_option = False
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token.startswith('-'):
+            flag, has_value, value = token.partition('=')
+            if flag not in options:
+                return None
+            if not has_value:
+                value = next(tokens, None)
+                if value is None or value.startswith('-'):
+                    return None
+            dest, _, choices = options[flag]
+            if choices and value not in choices:
+                return None
+            values[dest] = value
+            seen_option = True
+        elif seen_option:
+            # argparse splits positionals around options in ways not worth mirroring here
+            return None
+        else:
+            arguments.append(token)
+
+    for name in positionals:
+        if name.endswith('+'):
+            if not arguments:
+                return None
+            values[name[:-1]], arguments = arguments, []
+        elif name.endswith('?'):
+            values[name[:-1]] = arguments.pop(0) if arguments else None
+        elif arguments:
+            values[name] = arguments.pop(0)
+        else:
+            return None
+    if arguments:
+        return None
 
+    import types
+    return types.SimpleNamespace(**values)
 
-def main():
-    if len(sys.argv) < 2:
-        print_usage()
-        return
 
-    command = sys.argv[1]
-
-    if command == 'create' and len(sys.argv) >= 5:
-        os_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--os'), None)
-        arch_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--arch'), None)
-        files = [arg for arg in sys.argv[4:] if arg not in ('--os', '--arch') and arg != os_target and arg != arch_target]
-        create_package(sys.argv[2], sys.argv[3], files, os_target, arch_target)
-    elif command == 'install' and len(sys.argv) >= 4:
-        os_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--os'), None)
-        arch_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--arch'), None)
-        install_package(sys.argv[2], sys.argv[3], os_target, arch_target)
-    elif command == 'uninstall' and len(sys.argv) == 3:
-        uninstall_package(sys.argv[2])
-    elif command == 'list':
-        list_packages()
-    elif command == 'available':
-        source = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--source'), 'github')
-        if source == 'github':
-            list_available_packages_github()
-        elif source == 'website':
-            list_available_packages_website()
-        else:
-            print("Invalid source. Use --source github or --source website")
-    elif command == 'update' and len(sys.argv) >= 3:
-        version = sys.argv[3] if len(sys.argv) > 3 and not sys.argv[3].startswith('--') else None
-        os_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--os'), None)
-        arch_target = next((sys.argv[i+1] for i, arg in enumerate(sys.argv) if arg == '--arch'), None)
-        update_package(sys.argv[2], version, os_target, arch_target)
-    else:
-        print_usage()
+def build_parser(commands: List[str] = None) -> 'argparse.ArgumentParser':
+    # Only reached for help and usage errors; parse_command_line handles the common case
+    import argparse
+    parser = argparse.ArgumentParser(prog='bospm', description='Bellande Operating System Package Manager')
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    for command in commands or COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    args = parse_command_line(argv)
+    if args is None:
+        # Help, usage errors and unusual spellings are left to argparse. Only the subcommand
+        # being run needs its parser; help and unknown commands get the full tree
+        command = argv[0] if argv else None
+        parser = build_parser([command] if command in COMMAND_PARSERS else None)
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return
+    COMMAND_HANDLERS[args.command](args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+import pytest
+
+from bospm import bospm
+
+CHUNK = bospm.TREE_CHECKSUM_CHUNK_SIZE
+
+
+@pytest.mark.parametrize('size', [0, 1, CHUNK, CHUNK + 1])
+@pytest.mark.parametrize('mapped', [True, False])
+def test_tree_hasher_matches_file_checksum(tmp_path, monkeypatch, size, mapped):
+    if not mapped:
+        monkeypatch.setattr(bospm, 'map_file', lambda f: None)
+    data = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    path = tmp_path / 'package.tar.gz'
+    path.write_bytes(data)
+
+    # Uneven writes, like the blocks tarfile and the compressors hand to HashingWriter
+    hasher = bospm.TreeHasher()
+    for offset in range(0, size, 3 << 20):
+        hasher.update(data[offset:offset + (3 << 20)])
+
+    assert hasher.hexdigest() == bospm.calculate_tree_checksum(str(path))
@@ -0,0 +1,52 @@
+import contextlib
+import io
+import itertools
+
+import pytest
+
+from bospm import bospm
+
+TOKENS = ['p', '1', 'a', '--os', 'linux', '--os=x', '--arch', 'arm', '--compression', 'zst', '--compression=bz',
+          '--source', 'all', '--source=web', '-h', '--', '-1', '--comp', '']
+
+
+def argparse_namespace(argv):
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            return vars(bospm.build_parser().parse_args(argv))
+        except SystemExit:
+            return None
+
+
+@pytest.mark.parametrize('command', list(bospm.COMMAND_SHAPES))
+def test_fast_path_matches_argparse(command):
+    accepted = 0
+    for length in range(4):
+        for tokens in itertools.product(TOKENS, repeat=length):
+            argv = [command, *tokens]
+            fast = bospm.parse_command_line(argv)
+            if fast is None:
+                continue
+            accepted += 1
+            assert vars(fast) == argparse_namespace(argv), argv
+    assert accepted
+
+
+@pytest.mark.parametrize('argv', [
+    ['create', 'p', '1.0', 'a', 'b', '--os', 'linux', '--arch', 'x86_64', '--compression', 'zst'],
+    ['install', 'p', '1.0', '--os=linux', '--arch=x86_64'],
+    ['uninstall', 'p'],
+    ['list'],
+    ['available', '--source', 'website'],
+    ['update', 'p'],
+    ['update', 'p', '2.0', '--os', 'linux'],
+    ['info'],
+])
+def test_common_command_lines_take_fast_path(argv):
+    fast = bospm.parse_command_line(argv)
+    assert fast is not None
+    assert vars(fast) == argparse_namespace(argv)
+
+
+def test_every_command_has_a_shape_and_handler():
+    assert set(bospm.COMMAND_SHAPES) == set(bospm.COMMAND_PARSERS) == set(bospm.COMMAND_HANDLERS)